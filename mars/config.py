@@ -334,6 +334,9 @@ if working_memory is not None:
 default_options.register_option('learn.assume_finite', assume_finite, validator=any_validator(is_null, is_bool))
 default_options.register_option('learn.working_memory', working_memory, validator=any_validator(is_null, is_integer))
 
+# bit generator to sample uniform tensors with, 'aes' requires randomgen
+default_options.register_option('random.bit_generator', 'philox', validator=is_in(['philox', 'aes']))
+
 # the number of combined chunks in tree reduction or tree add
 default_options.register_option('combine_size', 4, validator=is_integer, serialize=True)
 
@@ -90,6 +90,12 @@ class SchedulingHint(Serializable):
         return True
 
 
+# names of scheduling hints are fixed, resolve them once
+# rather than for every operand created
+_scheduling_hint_names = tuple(SchedulingHint.all_hint_names)
+_scheduling_hint_name_set = frozenset(_scheduling_hint_names)
+
+
 def _install_scheduling_hint_properties(cls: Type["Operand"]):
     def get_hint(name):
         def _get_val(operand: "Operand"):
@@ -139,7 +145,7 @@ class Operand(Base, metaclass=OperandMetaclass):
     _output_types = ListField('output_type', FieldTypes.reference(OutputType))
 
     def __init__(self: OperandType, *args, **kwargs):
-        extra_names = set(kwargs) - set(self._FIELDS) - set(SchedulingHint.all_hint_names)
+        extra_names = kwargs.keys() - self._FIELDS.keys() - _scheduling_hint_name_set
         extras = AttributeDict((k, kwargs.pop(k)) for k in extra_names)
         kwargs['extra_params'] = kwargs.pop('extra_params', extras)
         self._extract_scheduling_hint(kwargs)
@@ -151,7 +157,7 @@ class Operand(Base, metaclass=OperandMetaclass):
             return
 
         scheduling_hint_kwargs = dict()
-        for hint_name in SchedulingHint.all_hint_names:
+        for hint_name in _scheduling_hint_names:
             if hint_name in kwargs:
                 scheduling_hint_kwargs[hint_name] = kwargs.pop(hint_name)
         if scheduling_hint_kwargs:
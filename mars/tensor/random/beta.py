@@ -18,7 +18,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorRandBeta(TensorDistribution, TensorRandomOperandMixin):
@@ -88,7 +89,7 @@ def beta(random_state, a, b, size=None, chunk_size=None, gpu=None, dtype=None):
         Drawn samples from the parameterized beta distribution.
     """
     if dtype is None:
-        dtype = np.random.RandomState().beta(
+        dtype = _probe_random_state.beta(
             handle_array(a), handle_array(b), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorBinomial(TensorDistribution, TensorRandomOperandMixin):
@@ -138,7 +139,7 @@ def binomial(random_state, n, p, size=None, chunk_size=None, gpu=None, dtype=Non
     # answer = 0.38885, or 38%.
     """
     if dtype is None:
-        dtype = np.random.RandomState().binomial(
+        dtype = _probe_random_state.binomial(
             handle_array(n), handle_array(p), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorChisquareDist(TensorDistribution, TensorRandomOperandMixin):
@@ -111,7 +112,7 @@ def chisquare(random_state, df, size=None, chunk_size=None, gpu=None, dtype=None
     array([ 1.89920014,  9.00867716,  3.13710533,  5.62318272])
     """
     if dtype is None:
-        dtype = np.random.RandomState().chisquare(
+        dtype = _probe_random_state.chisquare(
             handle_array(df), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -13,11 +13,18 @@
 # limitations under the License.
 
 
+import functools
 import itertools
+import threading
 from collections.abc import Iterable
 from contextlib import contextmanager
 
 import numpy as np
+try:
+    from numpy.random import Generator, Philox
+except ImportError:  # pragma: no cover
+    # numpy < 1.17
+    Generator = Philox = None
 
 from ...config import options
 from ...core import recursive_tile
@@ -74,8 +81,110 @@ class RandomState:
 
 _random_state = RandomState()
 
+# shared by distributions to infer dtypes of samples by drawing
+# zero-size outputs, which never consumes its state, thus no new
+# generator need to be seeded from OS entropy for each call
+_probe_random_state = np.random.RandomState(0)
+
+# generators cached by each executing thread
+_rng_pool = threading.local()
+
+
+def get_pooled_random_state(seed):
+    """
+    Get the RandomState cached by current thread, reseeded by `seed`.
+
+    Reseeding gives the same stream as `np.random.RandomState(seed)`
+    while saving the construction of a new generator for every chunk.
+    The returned object is shared, thus draws from it should be done
+    before the next call in the same thread.
+    """
+    try:
+        rs = _rng_pool.random_state
+    except AttributeError:
+        rs = _rng_pool.random_state = np.random.RandomState()
+    rs.seed(seed)
+    return rs
+
+
+def get_random_generator(seed, bit_generator=None):
+    """
+    Get the Philox generator cached by current thread, keyed by `seed`.
+
+    Philox is counter-based, so resetting the key and the counter of the
+    cached generator gives the same stream as `Generator(Philox(key=seed))`,
+    and streams of different chunks are independent given their keys.
+    Constructing Philox draws a SeedSequence from OS entropy, which now
+    happens once for each thread instead of once for every chunk. The
+    returned object is shared, thus draws from it should be done before
+    the next call in the same thread.
+
+    `bit_generator='aes'` selects AESCounter from randomgen, a counter-based
+    generator running AES rounds with AES-NI where available.
+    """
+    if bit_generator == 'aes':
+        from randomgen import AESCounter
+        return Generator(AESCounter(seed))
+    try:
+        gen, state = _rng_pool.philox
+    except AttributeError:
+        gen = Generator(Philox(key=0))
+        # state of a newly keyed Philox, with zero counter and empty buffer
+        state = gen.bit_generator.state
+        _rng_pool.philox = gen, state
+    state['state']['key'] = np.array([seed, 0], dtype=np.uint64)
+    gen.bit_generator.state = state
+    return gen
+
+
+# outputs larger than this are sampled and transformed tile by tile,
+# the size of a tile is kept well below the L2 cache of a core
+_TILE_THRESHOLD = 2 * 1024 ** 2
+_TILE_NBYTES = 32 * 1024
+
+
+def iter_tiles(out):
+    """
+    Iterate over contiguous flat views of a newly allocated `out`.
+
+    Samples of a tile can be drawn and then transformed while they are
+    still in cache, instead of streaming the whole output from memory
+    once for each pass. Small outputs are yielded in a single piece.
+    """
+    flat = out.reshape(-1)
+    if out.nbytes <= _TILE_THRESHOLD:
+        yield flat
+        return
+    step = max(_TILE_NBYTES // out.itemsize, 1)
+    for start in range(0, flat.size, step):
+        yield flat[start: start + step]
+
+
+@functools.lru_cache(maxsize=32)
+def _to_dtype(dtype):
+    return np.dtype(dtype)
+
+
+def to_dtype(dtype, default=None):
+    # random operands are created with a handful of distinct dtypes,
+    # thus resolve each of them only once
+    if dtype is None:
+        if default is None:
+            return None
+        # distributions with a static sample dtype pass it as default
+        dtype = default
+    try:
+        return _to_dtype(dtype)
+    except TypeError:
+        # unhashable specifications, e.g. lists of fields
+        return np.dtype(dtype)
+
 
 def handle_array(arg):
+    if isinstance(arg, (int, float)):
+        # fast path for python scalars, the most common parameters,
+        # which saves the costly check against abstract `Iterable`
+        return arg
     if not isinstance(arg, TENSOR_TYPE):
         if not isinstance(arg, Iterable):
             return arg
@@ -341,7 +450,10 @@ class TensorDistribution(TensorRandomOperand):
             device_id = op.device or 0
 
         with device(device_id):
-            rs = xp.random.RandomState(op.seed)
+            if xp is np:
+                rs = get_pooled_random_state(op.seed)
+            else:
+                rs = xp.random.RandomState(op.seed)
 
             args = []
             for k in op.args:
@@ -360,7 +472,10 @@ class TensorDistribution(TensorRandomOperand):
                     ctx[op.outputs[0].key] = res
             except AttributeError:
                 if xp is not np:
-                    # cupy cannot generate, fall back to numpy
+                    # cupy cannot generate, fall back to numpy.
+                    # no buffer pool is kept here: device memory comes
+                    # from the memory pool of cupy, and `asarray` stages
+                    # the copy through its pinned memory pool
                     rs = np.random.RandomState(op.seed)
                     res = getattr(rs, method_name)(*args)
                     ctx[op.outputs[0].key] = xp.asarray(res)
@@ -23,7 +23,8 @@ from ... import opcodes as OperandDef
 from ...serialization.serializables import TupleField
 from ...config import options
 from ..utils import decide_chunk_sizes, gen_random_seeds
-from .core import TensorRandomOperandMixin, TensorDistribution
+from .core import TensorRandomOperandMixin, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorDirichlet(TensorDistribution, TensorRandomOperandMixin):
@@ -152,7 +153,7 @@ def dirichlet(random_state, alpha, size=None, chunk_size=None, gpu=None, dtype=N
     else:
         raise TypeError('`alpha` should be an array')
     if dtype is None:
-        dtype = np.random.RandomState().dirichlet(alpha, size=(0,)).dtype
+        dtype = _probe_random_state.dirichlet(alpha, size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
     op = TensorDirichlet(seed=seed, alpha=alpha, size=size, gpu=gpu, dtype=dtype)
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorF(TensorDistribution, TensorRandomOperandMixin):
@@ -136,7 +137,7 @@ def f(random_state, dfnum, dfden, size=None, chunk_size=None, gpu=None, dtype=No
     level.
     """
     if dtype is None:
-        dtype = np.random.RandomState().f(
+        dtype = _probe_random_state.f(
             handle_array(dfnum), handle_array(dfden), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
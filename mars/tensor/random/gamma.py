@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorRandGamma(TensorDistribution, TensorRandomOperandMixin):
@@ -127,7 +128,7 @@ def gamma(random_state, shape, scale=1.0, size=None, chunk_size=None, gpu=None,
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().gamma(
+        dtype = _probe_random_state.gamma(
             handle_array(shape), handle_array(scale), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
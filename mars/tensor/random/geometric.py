@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorGeometric(TensorDistribution, TensorRandomOperandMixin):
@@ -94,7 +95,7 @@ def geometric(random_state, p, size=None, chunk_size=None, gpu=None, dtype=None)
     0.34889999999999999 #random
     """
     if dtype is None:
-        dtype = np.random.RandomState().geometric(
+        dtype = _probe_random_state.geometric(
             handle_array(p), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
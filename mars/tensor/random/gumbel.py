@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorGumbel(TensorDistribution, TensorRandomOperandMixin):
@@ -166,7 +167,7 @@ def gumbel(random_state, loc=0.0, scale=1.0, size=None, chunk_size=None, gpu=Non
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().gumbel(
+        dtype = _probe_random_state.gumbel(
             handle_array(loc), handle_array(scale), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorHypergeometric(TensorDistribution, TensorRandomOperandMixin):
@@ -146,7 +147,7 @@ def hypergeometric(random_state, ngood, nbad, nsample, size=None, chunk_size=Non
     #   answer = 0.003 ... pretty unlikely!
     """
     if dtype is None:
-        dtype = np.random.RandomState().hypergeometric(
+        dtype = _probe_random_state.hypergeometric(
             handle_array(ngood), handle_array(nbad), handle_array(nsample), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorLogseries(TensorDistribution, TensorRandomOperandMixin):
@@ -123,7 +124,7 @@ def logseries(random_state, p, size=None, chunk_size=None, gpu=None, dtype=None)
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().logseries(
+        dtype = _probe_random_state.logseries(
             handle_array(p), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
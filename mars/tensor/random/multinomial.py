@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import FieldTypes, Int64Field, TupleField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, TensorDistribution
+from .core import TensorRandomOperandMixin, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorMultinomial(TensorDistribution, TensorRandomOperandMixin):
@@ -137,7 +138,7 @@ def multinomial(random_state, n, pvals, size=None, chunk_size=None, gpu=None, dt
     n = int(n)
     pvals = tuple(pvals)
     if dtype is None:
-        dtype = np.random.RandomState().multinomial(n, pvals, size=(0,)).dtype
+        dtype = _probe_random_state.multinomial(n, pvals, size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
     op = TensorMultinomial(n=n, pvals=pvals, seed=seed,
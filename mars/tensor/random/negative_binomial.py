@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorNegativeBinomial(TensorDistribution, TensorRandomOperandMixin):
@@ -124,7 +125,7 @@ def negative_binomial(random_state, n, p, size=None, chunk_size=None, gpu=None,
     ...    print i, "wells drilled, probability of one success =", probability
     """
     if dtype is None:
-        dtype = np.random.RandomState().negative_binomial(
+        dtype = _probe_random_state.negative_binomial(
             handle_array(n), handle_array(p), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
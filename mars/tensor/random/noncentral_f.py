@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorNoncentralF(TensorDistribution, TensorRandomOperandMixin):
@@ -127,7 +128,7 @@ def noncentral_f(random_state, dfnum, dfden, nonc, size=None, chunk_size=None, g
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().noncentral_f(
+        dtype = _probe_random_state.noncentral_f(
             handle_array(dfnum), handle_array(dfden), handle_array(nonc), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorPoisson(TensorDistribution, TensorRandomOperandMixin):
@@ -112,7 +113,7 @@ def poisson(random_state, lam=1.0, size=None, chunk_size=None, gpu=None, dtype=N
     >>> s = mt.random.poisson(lam=(100., 500.), size=(100, 2))
     """
     if dtype is None:
-        dtype = np.random.RandomState().poisson(
+        dtype = _probe_random_state.poisson(
             handle_array(lam), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorRandomPower(TensorDistribution, TensorRandomOperandMixin):
@@ -143,7 +144,7 @@ def power(random_state, a, size=None, chunk_size=None, gpu=None, dtype=None):
     >>> plt.title('inverse of stats.pareto(5)')
     """
     if dtype is None:
-        dtype = np.random.RandomState().power(
+        dtype = _probe_random_state.power(
             handle_array(a), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorRayleigh(TensorDistribution, TensorRandomOperandMixin):
@@ -111,7 +112,7 @@ def rayleigh(random_state, scale=1.0, size=None, chunk_size=None, gpu=None, dtyp
     0.087300000000000003
     """
     if dtype is None:
-        dtype = np.random.RandomState().rayleigh(
+        dtype = _probe_random_state.rayleigh(
             handle_array(scale), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -18,7 +18,7 @@ import numpy as np
 
 from ... import opcodes as OperandDef
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, TensorDistribution
+from .core import TensorRandomOperandMixin, TensorDistribution, to_dtype
 
 
 class TensorStandardCauchy(TensorDistribution, TensorRandomOperandMixin):
@@ -27,7 +27,7 @@ class TensorStandardCauchy(TensorDistribution, TensorRandomOperandMixin):
     _fields_ = '_size',
 
     def __init__(self, size=None, dtype=None, **kw):
-        dtype = np.dtype(dtype) if dtype is not None else dtype
+        dtype = to_dtype(dtype, default=np.float64)
         super().__init__(_size=size, dtype=dtype, **kw)
 
     def __call__(self, chunk_size=None):
@@ -101,8 +101,6 @@ def standard_cauchy(random_state, size=None, chunk_size=None, gpu=None, dtype=No
     >>> plt.hist(s.execute(), bins=100)
     >>> plt.show()
     """
-    if dtype is None:
-        dtype = np.random.RandomState().standard_cauchy(size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
     op = TensorStandardCauchy(size=size, seed=seed, gpu=gpu, dtype=dtype)
@@ -18,7 +18,7 @@ import numpy as np
 
 from ... import opcodes as OperandDef
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, TensorDistribution
+from .core import TensorRandomOperandMixin, TensorDistribution, to_dtype
 
 
 class TensorStandardExponential(TensorDistribution, TensorRandomOperandMixin):
@@ -27,7 +27,7 @@ class TensorStandardExponential(TensorDistribution, TensorRandomOperandMixin):
     _fields_ = '_size',
 
     def __init__(self, size=None, dtype=None, **kw):
-        dtype = np.dtype(dtype) if dtype is not None else dtype
+        dtype = to_dtype(dtype, default=np.float64)
         super().__init__(_size=size, dtype=dtype, **kw)
 
     def __call__(self, chunk_size=None):
@@ -66,8 +66,6 @@ def standard_exponential(random_state, size=None, chunk_size=None, gpu=None, dty
     >>> import mars.tensor as mt
     >>> n = mt.random.standard_exponential((3, 8000))
     """
-    if dtype is None:
-        dtype = np.random.RandomState().standard_exponential(size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
     op = TensorStandardExponential(size=size, seed=seed, gpu=gpu, dtype=dtype)
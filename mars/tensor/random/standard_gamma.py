@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorStandardGamma(TensorDistribution, TensorRandomOperandMixin):
@@ -117,7 +118,7 @@ def standard_gamma(random_state, shape, size=None, chunk_size=None, gpu=None, dt
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().standard_gamma(
+        dtype = _probe_random_state.standard_gamma(
             handle_array(shape), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorStandardT(TensorDistribution, TensorRandomOperandMixin):
@@ -136,7 +137,7 @@ def standard_t(random_state, df, size=None, chunk_size=None, gpu=None, dtype=Non
     probability of about 99% of being true.
     """
     if dtype is None:
-        dtype = np.random.RandomState().standard_t(
+        dtype = _probe_random_state.standard_t(
             handle_array(df), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
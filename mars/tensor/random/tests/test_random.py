@@ -17,10 +17,14 @@
 import numpy as np
 import pytest
 
+from ....config import option_context
 from ....core import tile
 from ...datasource import tensor as from_ndarray
 from .. import beta, rand, choice, multivariate_normal, \
-    randint, randn, permutation, TensorPermutation, shuffle, RandomState
+    randint, randn, permutation, TensorPermutation, shuffle, RandomState, \
+    uniform, weibull, standard_normal, standard_exponential, standard_cauchy, \
+    TensorUniform, TensorWeibull
+from ..core import get_random_generator
 
 
 def test_random():
@@ -50,6 +54,57 @@ def test_random():
     assert arr.chunks[0].op.dtype == np.dtype('f8')
 
 
+def test_distribution_dtype():
+    assert uniform(0, 1, size=10).dtype == np.dtype('f8')
+    assert uniform(from_ndarray([1, 2], dtype='f4'), 3).dtype == np.dtype('f8')
+    assert uniform(0, 1, size=10, dtype='f4').dtype == np.dtype('f4')
+    assert weibull(5., size=10).dtype == np.dtype('f8')
+    assert weibull(5., size=10, dtype='f4').dtype == np.dtype('f4')
+    for func in (standard_normal, standard_exponential, standard_cauchy):
+        assert func(size=10).dtype == np.dtype('f8')
+        assert func(size=10, dtype='f4').dtype == np.dtype('f4')
+
+    assert TensorUniform(size=(10,)).dtype == np.dtype('f8')
+    assert TensorWeibull(size=(10,)).dtype == np.dtype('f8')
+
+    arr = tile(uniform(0, 1, size=10, chunk_size=3))
+    assert all(c.op.dtype == np.dtype('f8') for c in arr.chunks)
+
+
+def test_uniform_bit_generator():
+    assert uniform(0, 1, size=10).op.bit_generator == 'philox'
+
+    with option_context({'random.bit_generator': 'aes'}):
+        try:
+            import randomgen  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError):
+                uniform(0, 1, size=10, chunk_size=3)
+        else:
+            arr = tile(uniform(0, 1, size=10, chunk_size=3))
+            assert all(c.op.bit_generator == 'aes' for c in arr.chunks)
+
+
+def test_random_generator():
+    expected = np.random.Generator(np.random.Philox(key=123)).random(10)
+    gen = get_random_generator(123)
+    np.testing.assert_array_equal(gen.random(10), expected)
+
+    # generator cached by the thread is rekeyed
+    gen.random(3, dtype=np.float32)
+    get_random_generator(456).random(5)
+    np.testing.assert_array_equal(get_random_generator(123).random(10), expected)
+
+
+def test_distribution_arguments():
+    with pytest.raises(ValueError):
+        weibull(-1, size=10)
+    with pytest.raises(OverflowError):
+        uniform(0, np.inf, 10)
+    with pytest.raises(OverflowError):
+        uniform(-np.finfo(np.float64).max, np.finfo(np.float64).max, 10)
+
+
 def test_same_key():
     assert RandomState(0).rand(10).key == RandomState(0).rand(10).key
 
@@ -20,8 +20,10 @@ import numpy as np
 import pytest
 
 from .... import tensor
+from ....config import option_context
 from ....core import tile
 from ....lib.sparse.core import issparse
+from ....tests.core import require_cupy
 from ...datasource import tensor as from_ndarray
 
 
@@ -55,6 +57,154 @@ def test_random_integers_execution(setup):
     np.testing.assert_array_almost_equal(res1, res2)
 
 
+def test_uniform_execution(setup):
+    rs = tensor.random.RandomState(0)
+    arr = rs.uniform(-1, 2, size=(10, 20), chunk_size=8)
+    res = arr.execute().fetch()
+    assert res.shape == (10, 20)
+    assert res.dtype == np.float64
+    assert res.min() >= -1
+    assert res.max() < 2
+
+    rs = tensor.random.RandomState(0)
+    arr2 = rs.uniform(-1, 2, size=(10, 20), chunk_size=8)
+    np.testing.assert_array_equal(res, arr2.execute().fetch())
+
+    arr = rs.uniform(-1, 2, size=(10, 20), chunk_size=8, dtype='f4')
+    res = arr.execute().fetch()
+    assert res.dtype == np.float32
+    assert res.min() >= -1
+    assert res.max() <= 2
+
+    # test samples of U[0, 1)
+    for dtype in ('f8', 'f4'):
+        rs = tensor.random.RandomState(0)
+        arr = rs.uniform(0, 1, size=(10, 20), chunk_size=8, dtype=dtype)
+        res = arr.execute().fetch()
+        assert res.shape == (10, 20)
+        assert res.dtype == np.dtype(dtype)
+        assert res.min() >= 0
+        assert res.max() < 1
+        rs = tensor.random.RandomState(0)
+        arr2 = rs.uniform(0, 1, size=(10, 20), chunk_size=8, dtype=dtype)
+        np.testing.assert_array_equal(res, arr2.execute().fetch())
+
+    # test outputs sampled tile by tile
+    rs = tensor.random.RandomState(0)
+    arr = rs.uniform(-1, 2, size=(1024, 1024), chunk_size=1024, dtype='f4')
+    res = arr.execute().fetch()
+    assert res.min() >= -1
+    assert res.max() <= 2
+    rs = tensor.random.RandomState(0)
+    arr2 = rs.uniform(-1, 2, size=(1024, 1024), chunk_size=1024, dtype='f4')
+    np.testing.assert_array_equal(res, arr2.execute().fetch())
+
+    # test tensor params
+    low = from_ndarray(np.arange(20.), chunk_size=8)
+    arr = tensor.random.uniform(low, low + 1, size=(10, 20), chunk_size=8)
+    res = arr.execute().fetch()
+    assert res.shape == (10, 20)
+    assert (res >= np.arange(20.)).all()
+    assert (res < np.arange(20.) + 1).all()
+
+    high = from_ndarray(np.array([1., np.inf]), chunk_size=1)
+    arr = tensor.random.uniform(0, high, size=(3, 2), chunk_size=1)
+    with pytest.raises(OverflowError):
+        arr.execute()
+
+
+def test_uniform_aes_execution(setup):
+    pytest.importorskip('randomgen')
+
+    with option_context({'random.bit_generator': 'aes'}):
+        rs = tensor.random.RandomState(0)
+        arr = rs.uniform(-1, 2, size=(10, 20), chunk_size=8)
+        rs = tensor.random.RandomState(0)
+        arr2 = rs.uniform(-1, 2, size=(10, 20), chunk_size=8)
+    res = arr.execute().fetch()
+    assert res.shape == (10, 20)
+    assert res.min() >= -1
+    assert res.max() < 2
+    np.testing.assert_array_equal(res, arr2.execute().fetch())
+
+
+def test_weibull_execution(setup):
+    rs = tensor.random.RandomState(0)
+    arr = rs.weibull(.5, size=(10, 20), chunk_size=8)
+    res = arr.execute().fetch()
+    assert res.shape == (10, 20)
+    assert res.dtype == np.float64
+    assert res.min() >= 0
+
+    arr = rs.weibull(.5, size=(10, 20), chunk_size=8, dtype='f4')
+    res = arr.execute().fetch()
+    assert res.dtype == np.float32
+    assert res.min() >= 0
+
+    rs = tensor.random.RandomState(0)
+    rs.weibull(.5, size=(10, 20), chunk_size=8)
+    arr2 = rs.weibull(.5, size=(10, 20), chunk_size=8, dtype='f4')
+    np.testing.assert_array_equal(res, arr2.execute().fetch())
+
+    arr = tensor.random.weibull(0, size=(10, 20), chunk_size=8, dtype='f4')
+    np.testing.assert_array_equal(arr.execute().fetch(), 0)
+
+    # test outputs sampled tile by tile
+    rs = tensor.random.RandomState(0)
+    arr = rs.weibull(.5, size=(1024, 1024), chunk_size=1024, dtype='f4')
+    res = arr.execute().fetch()
+    assert res.dtype == np.float32
+    assert res.min() >= 0
+    assert np.isfinite(res).all()
+    rs = tensor.random.RandomState(0)
+    arr2 = rs.weibull(.5, size=(1024, 1024), chunk_size=1024, dtype='f4')
+    np.testing.assert_array_equal(res, arr2.execute().fetch())
+
+
+@require_cupy
+def test_uniform_gpu_execution(setup_gpu):
+    arr = tensor.random.uniform(-1, 2, size=(10, 20), chunk_size=8, gpu=True)
+    res = arr.execute().fetch().get()
+    assert res.shape == (10, 20)
+    assert res.dtype == np.float64
+    assert res.min() >= -1
+    assert res.max() < 2
+
+    arr = tensor.random.uniform(-1, 2, size=(10, 20), chunk_size=8,
+                                gpu=True, dtype='f4')
+    res = arr.execute().fetch().get()
+    assert res.dtype == np.float32
+    assert res.min() >= -1
+    assert res.max() <= 2
+
+
+@require_cupy
+def test_weibull_gpu_execution(setup_gpu):
+    rs = tensor.random.RandomState(0)
+    arr = rs.weibull(.5, size=(10, 20), chunk_size=8, gpu=True)
+    res = arr.execute().fetch().get()
+    assert res.shape == (10, 20)
+    assert res.dtype == np.float64
+    assert res.min() >= 0
+
+    rs = tensor.random.RandomState(0)
+    arr2 = rs.weibull(.5, size=(10, 20), chunk_size=8, gpu=True)
+    np.testing.assert_array_equal(res, arr2.execute().fetch().get())
+
+    # test tensor a containing zeros
+    a = from_ndarray(np.array([0., .5, 1.]), gpu=True)
+    arr = tensor.random.weibull(a, size=(10, 3), chunk_size=4, gpu=True)
+    res = arr.execute().fetch().get()
+    np.testing.assert_array_equal(res[:, 0], 0)
+    assert np.isfinite(res).all()
+    assert res.min() >= 0
+
+    a = from_ndarray(np.array([-1., .5]), gpu=True)
+    arr = tensor.random.weibull(a, size=(10, 2), chunk_size=4, gpu=True)
+    with pytest.raises(ValueError):
+        arr.execute()
+
+
 def test_choice_execution(setup):
     # test 1 chunk, get integer
     a = tensor.random.RandomState(0).choice(10)
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorTriangular(TensorDistribution, TensorRandomOperandMixin):
@@ -120,7 +121,7 @@ def triangular(random_state, left, mode, right, size=None, chunk_size=None, gpu=
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().triangular(
+        dtype = _probe_random_state.triangular(
             handle_array(left), handle_array(mode), handle_array(right), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
@@ -17,9 +17,16 @@
 import numpy as np
 
 from ... import opcodes as OperandDef
-from ...serialization.serializables import AnyField
+from ...config import options
+from ...serialization.serializables import AnyField, StringField
+from ...utils import lazy_import
+from ..array_utils import array_module, device
+from ..core import TENSOR_CHUNK_TYPE
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, TensorDistribution, \
+    Philox, get_random_generator, iter_tiles, to_dtype
+
+randomgen = lazy_import('randomgen', globals=globals())
 
 
 class TensorUniform(TensorDistribution, TensorRandomOperandMixin):
@@ -29,11 +36,13 @@ class TensorUniform(TensorDistribution, TensorRandomOperandMixin):
     _fields_ = '_low', '_high', '_size'
     _low = AnyField('low')
     _high = AnyField('high')
+    _bit_generator = StringField('bit_generator')
     _func_name = 'uniform'
 
-    def __init__(self, size=None, state=None, dtype=None, **kw):
-        dtype = np.dtype(dtype) if dtype is not None else dtype
-        super().__init__(_size=size, _state=state, dtype=dtype, **kw)
+    def __init__(self, size=None, dtype=None, bit_generator=None, **kw):
+        dtype = to_dtype(dtype, default=np.float64)
+        super().__init__(_size=size, dtype=dtype,
+                         _bit_generator=bit_generator, **kw)
 
     @property
     def low(self):
@@ -43,9 +52,72 @@ class TensorUniform(TensorDistribution, TensorRandomOperandMixin):
     def high(self):
         return self._high
 
+    @property
+    def bit_generator(self):
+        return self._bit_generator
+
     def __call__(self, low, high, chunk_size=None):
         return self.new_tensor([low, high], None, raw_chunk_size=chunk_size)
 
+    @classmethod
+    def _execute_gpu(cls, ctx, op):
+        xp = array_module(op.gpu)
+        low, high = (ctx[v.key] if isinstance(v, TENSOR_CHUNK_TYPE) else v
+                     for v in (op.low, op.high))
+        with device(op.device or 0):
+            # cupy samples with cuRAND on device, draw in the requested
+            # precision instead of casting float64 samples afterwards
+            rs = xp.random.RandomState(op.seed)
+            dtype = op.dtype if op.dtype in (np.float32, np.float64) else np.float64
+            res = rs.uniform(low, high, size=op.size, dtype=dtype)
+            if res.dtype != op.dtype:
+                res = res.astype(op.dtype, copy=False)
+            ctx[op.outputs[0].key] = res
+
+    @classmethod
+    def execute(cls, ctx, op):
+        if op.gpu:
+            return cls._execute_gpu(ctx, op)
+        if Philox is None:  # pragma: no cover
+            return super().execute(ctx, op)
+
+        gen = get_random_generator(op.seed, op.bit_generator)
+        low, high = (ctx[v.key] if isinstance(v, TENSOR_CHUNK_TYPE) else v
+                     for v in (op.low, op.high))
+        shape = op.outputs[0].shape
+        u_dtype = np.float32 if op.dtype == np.float32 else np.float64
+        if np.isscalar(low) and np.isscalar(high) and low == 0 and high == 1:
+            # samples of U[0, 1) need no affine transform at all
+            res = gen.random(op.size, dtype=u_dtype)
+        elif shape and (op.dtype == np.float32 or
+                        not np.isscalar(low) or not np.isscalar(high)):
+            # draw U[0, 1) and rescale in place with ufuncs, whose vectorized
+            # inner loops beat the per-element iteration of Generator.uniform
+            # over array parameters; float32 samples are built from 32-bit
+            # outputs of the generator instead of casting float64 ones
+            scale = np.subtract(high, low)
+            # the check done by Generator.uniform
+            if not np.isfinite(scale).all():
+                raise OverflowError('Range exceeds valid bounds')
+            res = np.empty(shape, dtype=u_dtype)
+            if np.isscalar(low) and np.isscalar(high):
+                tiles = iter_tiles(res)
+            else:
+                # array parameters are broadcast against the whole output
+                tiles = [res]
+            for tile in tiles:
+                gen.random(dtype=u_dtype, out=tile)
+                np.multiply(tile, scale, out=tile)
+                np.add(tile, low, out=tile)
+        else:
+            # Generator.uniform computes `low + (high - low) * u` as each
+            # sample is drawn, so the output is written in a single pass
+            # without materializing the samples of U[0, 1)
+            res = gen.uniform(low, high, size=op.size)
+        if hasattr(res, 'dtype') and res.dtype != op.dtype:
+            res = res.astype(op.dtype, copy=False)
+        ctx[op.outputs[0].key] = res
+
 
 def uniform(random_state, low=0.0, high=1.0, size=None, chunk_size=None, gpu=None, dtype=None):
     r"""
@@ -129,10 +201,13 @@ def uniform(random_state, low=0.0, high=1.0, size=None, chunk_size=None, gpu=Non
     >>> plt.plot(bins, mt.ones_like(bins).execute(), linewidth=2, color='r')
     >>> plt.show()
     """
-    if dtype is None:
-        dtype = np.random.RandomState().uniform(
-            handle_array(low), handle_array(high), size=(0,)).dtype
+    if np.isscalar(low) and np.isscalar(high) and not np.isfinite(high - low):
+        raise OverflowError('Range exceeds valid bounds')
+    bit_generator = options.random.bit_generator
+    if bit_generator == 'aes' and randomgen is None:
+        raise ImportError('randomgen is required to sample with the aes bit generator')
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
-    op = TensorUniform(size=size, seed=seed, gpu=gpu, dtype=dtype)
+    op = TensorUniform(size=size, seed=seed, gpu=gpu, dtype=dtype,
+                       bit_generator=bit_generator)
     return op(low, high, chunk_size=chunk_size)
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorVonmises(TensorDistribution, TensorRandomOperandMixin):
@@ -131,7 +132,7 @@ def vonmises(random_state, mu, kappa, size=None, chunk_size=None, gpu=None, dtyp
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().vonmises(
+        dtype = _probe_random_state.vonmises(
             handle_array(mu), handle_array(kappa), size=(0,)).dtype
 
     size = random_state._handle_size(size)
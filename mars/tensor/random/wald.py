@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorWald(TensorDistribution, TensorRandomOperandMixin):
@@ -115,7 +116,7 @@ def wald(random_state, mean, scale, size=None, chunk_size=None, gpu=None, dtype=
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().wald(
+        dtype = _probe_random_state.wald(
             handle_array(mean), handle_array(scale), size=(0,)).dtype
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
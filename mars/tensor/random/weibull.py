@@ -18,8 +18,11 @@ import numpy as np
 
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
+from ..array_utils import array_module, device
+from ..core import TENSOR_CHUNK_TYPE
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, TensorDistribution, \
+    Philox, get_random_generator, iter_tiles, to_dtype
 
 
 class TensorWeibull(TensorDistribution, TensorRandomOperandMixin):
@@ -31,7 +34,7 @@ class TensorWeibull(TensorDistribution, TensorRandomOperandMixin):
     _func_name = 'weibull'
 
     def __init__(self, size=None, dtype=None, **kw):
-        dtype = np.dtype(dtype) if dtype is not None else dtype
+        dtype = to_dtype(dtype, default=np.float64)
         super().__init__(_size=size, dtype=dtype, **kw)
 
     @property
@@ -41,6 +44,69 @@ class TensorWeibull(TensorDistribution, TensorRandomOperandMixin):
     def __call__(self, a, chunk_size=None):
         return self.new_tensor([a], None, raw_chunk_size=chunk_size)
 
+    @classmethod
+    def _execute_gpu(cls, ctx, op):
+        xp = array_module(op.gpu)
+        a = ctx[op.a.key] if isinstance(op.a, TENSOR_CHUNK_TYPE) else op.a
+        with device(op.device or 0):
+            # draw U[0, 1) with cuRAND and transform on device,
+            # thus samples never round-trip through host memory
+            rs = xp.random.RandomState(op.seed)
+            dtype = op.dtype if op.dtype in (np.float32, np.float64) else np.float64
+            if np.isscalar(a):
+                if a < 0:
+                    raise ValueError('a < 0')
+            else:
+                a = xp.asarray(a)
+                if bool((a < 0).any()):
+                    raise ValueError('a < 0')
+            res = rs.random_sample(op.outputs[0].shape, dtype=dtype)
+            xp.negative(res, out=res)
+            xp.log1p(res, out=res)
+            xp.negative(res, out=res)
+            if np.isscalar(a):
+                if a == 0:
+                    res.fill(0)
+                else:
+                    xp.power(res, 1. / a, out=res)
+            else:
+                # samples are 0 wherever a == 0, as numpy does
+                zero = a == 0
+                xp.power(res, 1. / xp.where(zero, 1, a), out=res)
+                xp.copyto(res, 0, where=zero)
+            if res.dtype != op.dtype:
+                res = res.astype(op.dtype, copy=False)
+            ctx[op.outputs[0].key] = res
+
+    @classmethod
+    def execute(cls, ctx, op):
+        if op.gpu:
+            return cls._execute_gpu(ctx, op)
+        if Philox is None:  # pragma: no cover
+            return super().execute(ctx, op)
+
+        gen = get_random_generator(op.seed)
+        a = ctx[op.a.key] if isinstance(op.a, TENSOR_CHUNK_TYPE) else op.a
+        shape = op.outputs[0].shape
+        if op.dtype == np.float32 and shape and np.isscalar(a) and a > 0:
+            # draw single precision exponentials directly and raise
+            # them to 1 / a in place, instead of casting float64 samples
+            res = np.empty(shape, dtype=np.float32)
+            for tile in iter_tiles(res):
+                gen.standard_exponential(dtype=np.float32, out=tile)
+                np.power(tile, np.float32(1. / a), out=tile)
+        else:
+            # `Generator.weibull` transforms each exponential sample
+            # as it is drawn, so no intermediate array is stored.
+            # No numba kernel is used here: a kernel cannot draw from the
+            # seeded generator of a chunk without losing reproducibility,
+            # thus it could only transform samples stored beforehand, and its
+            # threads would compete with chunks that Mars executes in parallel
+            res = gen.weibull(a, size=op.size)
+            if hasattr(res, 'dtype') and res.dtype != op.dtype:
+                res = res.astype(op.dtype, copy=False)
+        ctx[op.outputs[0].key] = res
+
 
 def weibull(random_state, a, size=None, chunk_size=None, gpu=None, dtype=None):
     r"""
@@ -140,9 +206,8 @@ def weibull(random_state, a, size=None, chunk_size=None, gpu=None, dtype=None):
     >>> plt.plot(x.execute(), (weib(x, 1., 5.)*scale).execute())
     >>> plt.show()
     """
-    if dtype is None:
-        dtype = np.random.RandomState().weibull(
-            handle_array(a), size=(0,)).dtype
+    if np.isscalar(a) and a < 0:
+        raise ValueError('a < 0')
     size = random_state._handle_size(size)
     seed = gen_random_seeds(1, random_state.to_numpy())[0]
     op = TensorWeibull(size=size, seed=seed, gpu=gpu, dtype=dtype)
@@ -19,7 +19,8 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import AnyField
 from ..utils import gen_random_seeds
-from .core import TensorRandomOperandMixin, handle_array, TensorDistribution
+from .core import TensorRandomOperandMixin, handle_array, TensorDistribution, \
+    _probe_random_state
 
 
 class TensorZipf(TensorDistribution, TensorRandomOperandMixin):
@@ -122,7 +123,7 @@ def zipf(random_state, a, size=None, chunk_size=None, gpu=None, dtype=None):
     >>> plt.show()
     """
     if dtype is None:
-        dtype = np.random.RandomState().zipf(
+        dtype = _probe_random_state.zipf(
             handle_array(a), size=(0,)).dtype
 
     size = random_state._handle_size(size)